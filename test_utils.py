@@ -0,0 +1,238 @@
+# This source file is part of the Daneshjou Lab projects
+#
+# SPDX-FileCopyrightText: 2024 Stanford University and the project authors (see AUTHORS.md)
+#
+# SPDX-License-Identifier: MIT
+
+"""
+Tests pinning the per-specimen output of the pathology report extraction in utils.
+"""
+
+import pandas as pd
+
+from utils import (
+    extract_clinical_impression,
+    extract_specimen_details,
+    process_pathology_reports,
+)
+
+LETTERED_REPORT = """Accession No: S24-12345
+SPECIMEN SUBMITTED:
+A. Skin, left forearm, shave
+B. Skin, right back, punch
+
+DIAGNOSIS:
+A. Skin, left forearm, shave:
+  -- Basal cell carcinoma, nodular type
+B. Skin, right back, punch:
+  -- Seborrheic keratosis
+
+MICROSCOPIC DESCRIPTION:
+A) Left forearm - Nests of basaloid cells with peripheral palisading.
+B) Right back - Acanthotic epidermis with horn cysts.
+
+CLINICAL IMPRESSION:
+A) r/o BCC
+B) r/o SK
+"""
+
+UNLETTERED_REPORT = """Accession No: S24-999
+SPECIMEN SUBMITTED:
+Skin, nose
+Skin, cheek
+
+DIAGNOSIS:
+A. Skin, nose:
+  -- Actinic keratosis
+MICROSCOPIC DESCRIPTION:
+Sections show atypical keratinocytes.
+CLINICAL IMPRESSION:
+AK vs SCC
+"""
+
+NUMBERED_REPORT = """Accession No: S24-555
+SPECIMEN SUBMITTED:
+A. Skin, ear
+B. Skin, scalp
+
+DIAGNOSIS:
+A. Skin, ear:
+  -- Melanocytic nevus
+B. Skin, scalp:
+  -- Epidermoid cyst
+
+MICROSCOPIC DESCRIPTION:
+A)
+B) Scalp - Cyst lined by stratified squamous epithelium.
+
+CLINICAL IMPRESSION:
+#1- nevus #2- cyst
+"""
+
+INLINE_ACCESSION_REPORT = """Dermatopathology consult, Accession No: S-77
+SPECIMEN SUBMITTED:
+A. Skin, arm
+B. Skin, leg
+
+MICROSCOPIC DESCRIPTION:
+B) Leg - Acanthosis with horn cysts.
+
+CLINICAL IMPRESSION:
+A) Ruled out diagnosis: BCC
+B) SK
+"""
+
+
+def _records(text):
+    """Return the extracted specimen details of a report as a list of row dicts."""
+    return extract_specimen_details(text).to_dict("records")
+
+
+def test_lettered_report():
+    """Each lettered specimen gets its own diagnosis, description, and impression."""
+    assert _records(LETTERED_REPORT) == [
+        {
+            "Accession No": "S24-12345",
+            "Specimen Identifier": "A",
+            "Specimen Description": "Skin, left forearm, shave",
+            "Diagnosis": "Basal cell carcinoma, nodular type",
+            "Microscopic Description": "Nests of basaloid cells with peripheral palisading.",
+            "Clinical Impression": "r/o BCC",
+        },
+        {
+            "Accession No": "S24-12345",
+            "Specimen Identifier": "B",
+            "Specimen Description": "Skin, right back, punch",
+            "Diagnosis": "Seborrheic keratosis",
+            "Microscopic Description": "Acanthotic epidermis with horn cysts.",
+            "Clinical Impression": "r/o SK",
+        },
+    ]
+
+
+def test_unlettered_report_shares_sections():
+    """Unlettered specimens are lettered in order and share unlabelled sections."""
+    assert _records(UNLETTERED_REPORT) == [
+        {
+            "Accession No": "S24-999",
+            "Specimen Identifier": "A",
+            "Specimen Description": "Skin, nose",
+            "Diagnosis": "Actinic keratosis",
+            "Microscopic Description": "Sections show atypical keratinocytes.",
+            "Clinical Impression": "AK vs SCC",
+        },
+        {
+            "Accession No": "S24-999",
+            "Specimen Identifier": "B",
+            "Specimen Description": "Skin, cheek",
+            "Diagnosis": "",
+            "Microscopic Description": "Sections show atypical keratinocytes.",
+            "Clinical Impression": "AK vs SCC",
+        },
+    ]
+
+
+def test_numbered_impressions_and_empty_microscopic_item():
+    """Numbered impressions map to letters and an empty item does not take the next line."""
+    records = _records(NUMBERED_REPORT)
+    assert [record["Diagnosis"] for record in records] == [
+        "Melanocytic nevus",
+        "Epidermoid cyst",
+    ]
+    assert [record["Microscopic Description"] for record in records] == [
+        "",
+        "Cyst lined by stratified squamous epithelium.",
+    ]
+    assert [record["Clinical Impression"] for record in records] == ["nevus", "cyst"]
+
+
+def test_colon_identifiers():
+    """Items in the "A:" form are not mistaken for a sub-heading ending the section."""
+    records = _records(
+        "Accession No: S24-321\nSPECIMEN SUBMITTED:\nA. Skin, arm\nB. Skin, leg\n\n"
+        "MICROSCOPIC DESCRIPTION:\nA: Arm - Basaloid nests\nB: Leg - Horn cysts\n\n"
+        "CLINICAL IMPRESSION:\nA: bcc\nB: sk\nPLAN: follow up\n"
+    )
+    assert [record["Microscopic Description"] for record in records] == [
+        "Basaloid nests",
+        "Horn cysts",
+    ]
+    assert [record["Clinical Impression"] for record in records] == ["bcc", "sk"]
+
+
+def test_inline_accession_and_line_start_headers():
+    """A mid-line accession is found and a mid-line header does not end a section."""
+    assert _records(INLINE_ACCESSION_REPORT) == [
+        {
+            "Accession No": "S-77",
+            "Specimen Identifier": "A",
+            "Specimen Description": "Skin, arm",
+            "Diagnosis": "",
+            "Microscopic Description": "",
+            "Clinical Impression": "Ruled out diagnosis: BCC",
+        },
+        {
+            "Accession No": "S-77",
+            "Specimen Identifier": "B",
+            "Specimen Description": "Skin, leg",
+            "Diagnosis": "",
+            "Microscopic Description": "Acanthosis with horn cysts.",
+            "Clinical Impression": "SK",
+        },
+    ]
+
+
+def test_inline_specimen_header():
+    """A section header following other text on its line still starts its section."""
+    assert _records(
+        "Accession No: X2 SPECIMEN SUBMITTED: A. Skin, arm\n\n"
+        "DIAGNOSIS:\nA. Skin, arm:\n  -- Dermatofibroma\n"
+    ) == [
+        {
+            "Accession No": "X2",
+            "Specimen Identifier": "A",
+            "Specimen Description": "Skin, arm",
+            "Diagnosis": "Dermatofibroma",
+            "Microscopic Description": "",
+            "Clinical Impression": "",
+        }
+    ]
+    records = _records(
+        "Accession No: X3 SPECIMEN SUBMITTED:\nA. Skin, arm\nB. Skin, leg\n\n"
+        "CLINICAL IMPRESSION:\nA) DF\nB) nevus\n"
+    )
+    assert [record["Specimen Description"] for record in records] == [
+        "Skin, arm",
+        "Skin, leg",
+    ]
+    assert [record["Clinical Impression"] for record in records] == ["DF", "nevus"]
+
+
+def test_extract_clinical_impression_returns_shared_impression():
+    """An unlabelled impression is returned for every specimen and as the shared value."""
+    assert extract_clinical_impression(UNLETTERED_REPORT) == (
+        {"A": "AK vs SCC", "B": "AK vs SCC"},
+        "AK vs SCC",
+    )
+    impressions, shared_impression = extract_clinical_impression(LETTERED_REPORT)
+    assert impressions == {"A": "r/o BCC", "B": "r/o SK"}
+    assert shared_impression is None
+
+
+def test_process_pathology_reports_keeps_row_columns():
+    """Each specimen row keeps the columns of the report it came from."""
+    df = pd.DataFrame(
+        {
+            "Patient": ["p1", "p2", "p3"],
+            "Path Report Text": [LETTERED_REPORT, None, UNLETTERED_REPORT],
+        }
+    )
+    processed_df = process_pathology_reports(df)
+    assert processed_df["Patient"].tolist() == ["p1", "p1", "p3", "p3"]
+    assert processed_df["Specimen Identifier"].tolist() == ["A", "B", "A", "B"]
+    assert processed_df["Clinical Impression"].tolist() == [
+        "r/o BCC",
+        "r/o SK",
+        "AK vs SCC",
+        "AK vs SCC",
+    ]
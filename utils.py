@@ -11,67 +11,201 @@ clinical impressions, diagnoses, and microscopic descriptions from pathology rep
 """
 
 # Import dependencies
+import os
 import re
+from concurrent.futures import ProcessPoolExecutor
 import pandas as pd
 
-
-def extract_accession_and_specimens_df(text):
+# Number of reports sent to a worker process at a time
+_REPORTS_PER_CHUNK = 32
+
+# Precompiled patterns, shared by every report processed in this module
+# Section headers, all located in a single pass over the report text
+_SECTIONS_RE = re.compile(
+    r"(?P<header>ACCESSION NO|SPECIMEN SUBMITTED|DIAGNOSIS"
+    r"|MICROSCOPIC DESCRIPTION|CLINICAL IMPRESSION):",
+    re.IGNORECASE,
+)
+# Patterns applied to a section body (the text between its header and the next one)
+_ACCESSION_RE = re.compile(r"\s*(\S+)")
+# Upper-case sub-headings of two or more letters (e.g., "PLAN:"), unlike identifiers such as "B:"
+_SUB_HEADING_RE = re.compile(r"\n[ \t]*[A-Z][A-Z ]*[A-Z]:")
+_SPECIMEN_IDENT_RE = re.compile(r"([A-Z])\.\s*([^\n]+)")
+# Clinical impression identifiers, most common form first ("A)" / "A:", "Lesion A", "#1-").
+# Case-sensitive, since only upper-case letters name a specimen and prose such as
+# "diagnosis:" must not be split
+_IDENTIFIER_RE = re.compile(r"[A-Z][\):]|Lesion [A-Z][\):]?|#\d+-")
+# Translation table dropping the identifier punctuation ")", "-", ":" and "#"
+_IDENT_CLEAN_TBL = str.maketrans("", "", ")-:#")
+# Match identifier, location, and description on a single line
+_MICRO_ITEM_RE = re.compile(
+    r"^([A-Z][\.\):])[ \t]*([^\n]*?)[ \t]*-[ \t]*([^\n]+)$",
+    re.IGNORECASE | re.MULTILINE,
+)
+_DIAGNOSIS_RE = re.compile(
+    r"([A-Z])[\.\):]?\s*(.+?)\n\s*--\s*(.+?)(?=\n[A-Z][\.\):]|\n\n|$)",
+    re.IGNORECASE | re.DOTALL,
+)
+
+# Output columns for the submitted specimens and the details extracted for each of them
+_SPECIMEN_COLUMNS = ["Accession No", "Specimen Identifier", "Specimen Description"]
+_DETAIL_COLUMNS = ["Diagnosis", "Microscopic Description", "Clinical Impression"]
+
+
+def _split_sections(text):
     """
-    Extracts the Accession Number and Specimens from the path report text in two formats
-    and returns them in a DataFrame.
+    Splits the path report text into its sections with a single scan for the section headers.
+    A section starts at the first occurrence of its header anywhere in the text, but only
+    headers at the start of a line end a section, so a sentence such as "prior melanoma
+    diagnosis: 2019" stays in its section.
 
     Args:
         text (str): The input text containing the path report details.
 
     Returns:
-        pd.DataFrame: A DataFrame with columns "Accession No", "Specimen Identifier", and
-            "Specimen Description".
+        dict: A dictionary where keys are upper-cased section headers (e.g., "DIAGNOSIS") and
+          values are the text following the first occurrence of each header up to the next
+          header at the start of a line.
+    """
+    headers = list(_SECTIONS_RE.finditer(text))
+
+    # Offsets of the headers preceded only by whitespace on their line
+    section_ends = [
+        header.start()
+        for header in headers
+        if not text[text.rfind("\n", 0, header.start()) + 1 : header.start()].strip()
+    ]
+
+    sections = {}
+    for header in headers:
+        name = header.group("header").upper()
+        if name in sections:
+            continue
+        body_end = next(
+            (start for start in section_ends if start >= header.end()), len(text)
+        )
+        sections[name] = text[header.end() : body_end]
+    return sections
+
+
+def _parse_specimens(sections):
+    """
+    Parses the Accession Number and Specimens from the path report sections in two formats.
+
+    Args:
+        sections (dict): The report sections as returned by `_split_sections`.
+
+    Returns:
+        tuple: The Accession Number (None if absent) and a list of
+          (specimen identifier, specimen description) tuples.
     """
     # Initialize storage for data
     accession_no = None
-    specimen_data = []
+    specimens = []
 
     # Extract the Accession Number
-    accession_match = re.search(r"Accession No:\s*(\S+)", text, re.IGNORECASE)
+    accession_match = _ACCESSION_RE.match(sections.get("ACCESSION NO", ""))
     if accession_match:
         accession_no = accession_match.group(1).strip()
 
-    # Extract specimens after "SPECIMEN SUBMITTED:"
-    specimen_section_match = re.search(
-        r"SPECIMEN SUBMITTED:\s*(.+?)(?:\n\n|\Z)", text, re.IGNORECASE | re.DOTALL
+    # Extract specimens after "SPECIMEN SUBMITTED:", up to the first blank line
+    specimen_section = (
+        sections.get("SPECIMEN SUBMITTED", "").strip().partition("\n\n")[0].strip()
     )
-    if specimen_section_match:
-        specimen_section = specimen_section_match.group(1).strip()
+    if specimen_section:
 
         # Check for format with identifiers (e.g., A., B., etc.)
-        specimens_with_identifiers = re.findall(
-            r"([A-Z])\.\s*([^\n]+)", specimen_section
-        )
+        specimens_with_identifiers = _SPECIMEN_IDENT_RE.findall(specimen_section)
         if specimens_with_identifiers:
-            for match in specimens_with_identifiers:
-                specimen_id, specimen_desc = match[0], match[1].strip()
-                specimen_data.append(
-                    {
-                        "Accession No": accession_no,
-                        "Specimen Identifier": specimen_id,
-                        "Specimen Description": specimen_desc,
-                    }
-                )
+            for specimen_id, specimen_desc in specimens_with_identifiers:
+                specimens.append((specimen_id, specimen_desc.strip()))
         else:
-            # Format without identifiers (e.g., just list of specimens)
-            specimens = specimen_section.split("\n")
-            for index, specimen_desc in enumerate(specimens, start=1):
-                specimen_data.append(
-                    {
-                        "Accession No": accession_no,
-                        "Specimen Identifier": chr(
-                            64 + index
-                        ),  # Generate identifiers A, B, C, etc.
-                        "Specimen Description": specimen_desc.strip(),
-                    }
-                )
+            # Format without identifiers (e.g., just list of specimens), skipping blank lines
+            specimen_descs = (line.strip() for line in specimen_section.splitlines())
+            for index, specimen_desc in enumerate(
+                filter(None, specimen_descs), start=1
+            ):
+                # Generate identifiers A, B, C, etc.
+                specimens.append((chr(64 + index), specimen_desc))
+
+    return accession_no, specimens
+
+
+def _columns_df(columns):
+    """
+    Builds a DataFrame from column lists in a single constructor call.
+
+    Args:
+        columns (dict): A dictionary where keys are column names and values are equal-length
+          lists of cell values.
+
+    Returns:
+        pd.DataFrame: A DataFrame with the given columns.
+    """
+    if not any(columns.values()):
+        # Empty column lists would be inferred as float, so keep the empty columns as object
+        return pd.DataFrame(columns=list(columns), dtype=object)
+    return pd.DataFrame(columns, copy=False)
+
+
+def _specimens_df(accession_no, specimens):
+    """
+    Builds the specimen DataFrame from the output of `_parse_specimens`.
+
+    Args:
+        accession_no (str): The Accession Number of the path report.
+        specimens (list): The (specimen identifier, specimen description) tuples.
+
+    Returns:
+        pd.DataFrame: A DataFrame with columns "Accession No", "Specimen Identifier", and
+            "Specimen Description".
+    """
+    return _columns_df(
+        {
+            "Accession No": [accession_no] * len(specimens),
+            "Specimen Identifier": [specimen_id for specimen_id, _ in specimens],
+            "Specimen Description": [specimen_desc for _, specimen_desc in specimens],
+        }
+    )
+
+
+def _section_text(sections, header):
+    """
+    Returns the text of a report section up to its first sub-heading (e.g., "PLAN:") or the
+    end of the section.
+
+    Args:
+        sections (dict): The report sections as returned by `_split_sections`.
+        header (str): The upper-cased section header (e.g., "CLINICAL IMPRESSION").
+
+    Returns:
+        str: The stripped section text, empty if the section is missing.
+    """
+    section_text = sections.get(header, "").strip()
+    sub_heading = _SUB_HEADING_RE.search(section_text)
+    if sub_heading:
+        section_text = section_text[: sub_heading.start()].strip()
+    return section_text
+
+
+def extract_accession_and_specimens_df(text, sections=None):
+    """
+    Extracts the Accession Number and Specimens from the path report text in two formats
+    and returns them in a DataFrame.
+
+    Args:
+        text (str): The input text containing the path report details.
+        sections (dict, optional): The report sections as returned by `_split_sections`.
+            Split from `text` when not provided.
 
-    return pd.DataFrame(specimen_data)
+    Returns:
+        pd.DataFrame: A DataFrame with columns "Accession No", "Specimen Identifier", and
+            "Specimen Description".
+    """
+    if sections is None:
+        sections = _split_sections(text)
+
+    return _specimens_df(*_parse_specimens(sections))
 
 
 def remove_text_after_newline(cell_text):
@@ -91,7 +225,7 @@ def remove_text_after_newline(cell_text):
     ].strip()  # Keep only the part before the first newline
 
 
-def extract_clinical_impression(text):
+def extract_clinical_impression(text, sections=None, specimens=None):
     """
     Extracts Clinical Impression information for each specimen. If no specimen-specific
     identifiers are found after "CLINICAL IMPRESSION:", assumes the same text applies to all
@@ -99,135 +233,203 @@ def extract_clinical_impression(text):
 
     Args:
         text (str): The input text containing the Clinical Impression section.
+        sections (dict, optional): The report sections as returned by `_split_sections`.
+            Split from `text` when not provided.
+        specimens (list, optional): The (specimen identifier, specimen description) tuples
+            as returned by `_parse_specimens`. Parsed from the sections when not provided.
 
     Returns:
-        dict: A dictionary where keys are specimen identifiers (e.g., A, B) and values are the
-          impressions.
+        tuple: A dictionary where keys are specimen identifiers (e.g., A, B) and values are the
+          impressions, and the impression text shared by all specimens when no identifiers
+          were found (None otherwise).
     """
-    # Step 1: Extract Specimen Mapping from "SPECIMEN SUBMITTED"
-    specimen_mapping = {}
-    specimen_submitted_section = re.search(
-        r"SPECIMEN SUBMITTED:\s*(.+?)(?=\n\n|DIAGNOSIS:)",
-        text,
-        re.IGNORECASE | re.DOTALL,
-    )
-    if specimen_submitted_section:
-        specimens = re.findall(
-            r"([A-Z])[\.\):]?\s*(.+)", specimen_submitted_section.group(1)
-        )
-        for idx, (identifier, _) in enumerate(specimens, start=1):
-            specimen_mapping[str(idx)] = identifier.strip()  # Map #1, #2 to A, B, etc.
-            specimen_mapping[identifier.strip()] = (
-                identifier.strip()
-            )  # Map A, B directly
+    if sections is None:
+        sections = _split_sections(text)
+    if specimens is None:
+        _, specimens = _parse_specimens(sections)
+
+    # Step 1: Map specimen numbers (#1, #2) to the "SPECIMEN SUBMITTED" identifiers (A, B)
+    specimen_numbers = {
+        str(idx): identifier for idx, (identifier, _) in enumerate(specimens, start=1)
+    }
 
-    # Initialize impressions dictionary
-    impressions = {specimen: "" for specimen in specimen_mapping.values()}
+    # Initialize impressions dictionary, keyed by specimen identifier
+    impressions = {identifier: "" for identifier, _ in specimens}
+    shared_impression = None
 
     # Step 2: Locate the Clinical Impression section
-    clinical_impression_section = re.search(
-        r"CLINICAL IMPRESSION:\s*(.+?)(?=\n[A-Z ]+:|$)",  # Stop at the next section or end of text
-        text,
-        re.IGNORECASE | re.DOTALL,
-    )
-    if clinical_impression_section:
-        clinical_impression_text = clinical_impression_section.group(1).strip()
-
+    clinical_impression_text = _section_text(sections, "CLINICAL IMPRESSION")
+    if clinical_impression_text:
         # Step 3: Detect identifiers
-        identifiers = re.findall(
-            r"([A-Z]\)|[A-Z]:|#\d+-|Lesion [A-Z])",
-            clinical_impression_text,
-            re.IGNORECASE,
-        )
+        identifiers = list(_IDENTIFIER_RE.finditer(clinical_impression_text))
 
         if identifiers:
             # Step 4: Extract information for each identifier
-            for idx, identifier in enumerate(identifiers):
-                # Define the start of the identifier
-                start_pos = clinical_impression_text.find(identifier)
-
+            for idx, identifier_match in enumerate(identifiers):
                 # Define the end of the identifier's information (next identifier or end of text)
                 end_pos = (
-                    clinical_impression_text.find(identifiers[idx + 1])
+                    identifiers[idx + 1].start()
                     if idx + 1 < len(identifiers)
                     else len(clinical_impression_text)
                 )
 
                 # Extract the text for this identifier
                 impression_text = clinical_impression_text[
-                    start_pos + len(identifier) : end_pos
+                    identifier_match.end() : end_pos
                 ].strip()
 
                 # Map to corresponding specimen, cleaning up format
                 # (e.g., "A)" -> "A", "A:" -> "A", "#1-" -> "1")
                 clean_identifier = (
-                    re.sub(r"[\)\-:#]", "", identifier).replace("Lesion ", "").strip()
+                    identifier_match.group(0)
+                    .translate(_IDENT_CLEAN_TBL)
+                    .replace("Lesion ", "")
+                    .strip()
                 )
-                if clean_identifier in specimen_mapping:
-                    # mapped_id = specimen_mapping[clean_identifier]
-                    impressions[specimen_mapping[clean_identifier]] += (
-                        impression_text.strip() + " "
-                    )
+                specimen_id = specimen_numbers.get(clean_identifier, clean_identifier)
+                if specimen_id in impressions:
+                    impressions[specimen_id] += impression_text.strip() + " "
         else:
             # No identifiers found.
+            shared_impression = clinical_impression_text
             for specimen in impressions.keys():
                 impressions[specimen] = clinical_impression_text
 
     # Clean up impressions (remove extra spaces)
     impressions = {k: v.strip() for k, v in impressions.items()}
 
-    return impressions
+    return impressions, shared_impression
 
 
-def add_microscopic_description(text, specimen_data):
+def _parse_microscopic_descriptions(sections):
+    """
+    Parses the Microscopic Description of each specimen from the path report sections.
+
+    Args:
+        sections (dict): The report sections as returned by `_split_sections`.
+
+    Returns:
+        tuple: A dictionary where keys are specimen identifiers (e.g., A, B) and values are the
+          descriptions, and the description text shared by all specimens when no identifiers
+          were found (None otherwise).
+    """
+    # Capture text until the next section header or end of text
+    micro_desc_text = _section_text(sections, "MICROSCOPIC DESCRIPTION")
+    if not micro_desc_text:
+        return {}, None
+
+    # Try to match specimen-specific identifiers and descriptions
+    micro_desc_matches = _MICRO_ITEM_RE.findall(micro_desc_text)
+
+    if micro_desc_matches:
+        # Case: Multiple specimens with identifiers, keyed by the identifier letter
+        return {match[0][0]: match[2].strip() for match in micro_desc_matches}, None
+
+    # Case: No valid identifiers and apply the entire description to all specimens
+    return {}, micro_desc_text
+
+
+def add_microscopic_description(text, specimen_data, sections=None):
     """
     Extract and populate the Microscopic Description column in the DataFrame.
 
     Args:
         text (str): The input text containing the Path Report.
         specimen_data (pd.DataFrame): The DataFrame containing specimen details.
+        sections (dict, optional): The report sections as returned by `_split_sections`.
+            Split from `text` when not provided.
 
     Returns:
         pd.DataFrame: Updated DataFrame with Microscopic Description.
     """
-    # Capture text until the next section header or end of text
-    micro_desc_section = re.search(
-        r"MICROSCOPIC DESCRIPTION:\s*(.+?)(?=\n[A-Z ]+:|$)",
-        text,
-        re.IGNORECASE | re.DOTALL,
-    )
-    if not micro_desc_section:
-        return specimen_data
+    if sections is None:
+        sections = _split_sections(text)
+
+    descriptions, shared_description = _parse_microscopic_descriptions(sections)
+    if shared_description is not None:
+        specimen_data["Microscopic Description"] = shared_description
+    elif descriptions:
+        specimen_data["Microscopic Description"] = (
+            specimen_data["Specimen Identifier"].map(descriptions).fillna("")
+        )
 
-    micro_desc_text = micro_desc_section.group(1).strip()
+    return specimen_data
 
-    # Try to match specimen-specific identifiers and descriptions
-    micro_desc_matches = re.findall(
-        r"^([A-Z][\.\):])\s*(.*?)\s*-\s*(.+)$",  # Match identifier, location, and description
-        micro_desc_text,
-        re.IGNORECASE | re.DOTALL | re.MULTILINE,
+
+def _specimen_values(specimen_ids, values, shared_value):
+    """
+    Lists the value of each specimen, or the shared value for all of them when there is one.
+
+    Args:
+        specimen_ids (list): The specimen identifiers.
+        values (dict): A dictionary where keys are specimen identifiers and values are the
+          specimen values.
+        shared_value (str): The value shared by all specimens, or None.
+
+    Returns:
+        list: The value of each specimen, empty strings for specimens without one.
+    """
+    if shared_value is not None:
+        return [shared_value] * len(specimen_ids)
+    return [values.get(specimen_id, "") for specimen_id in specimen_ids]
+
+
+def _extract_specimen_columns(text):
+    """
+    Extracts the details of each specimen in the Path Report Text as plain column lists,
+    so that many reports can be combined into a single DataFrame.
+
+    Args:
+        text (str): The input text containing the Path Report.
+
+    Returns:
+        dict: A dictionary where keys are the column names of `extract_specimen_details` and
+          values are lists with one entry per specimen, before the newline cleanup.
+    """
+    sections = _split_sections(text)
+    accession_no, specimens = _parse_specimens(sections)
+    specimen_ids = [specimen_id for specimen_id, _ in specimens]
+
+    # Extract Diagnosis
+    diagnoses = {match[0]: match[2].strip() for match in _DIAGNOSIS_RE.findall(text)}
+
+    # Extract Microscopic Description
+    descriptions, shared_description = _parse_microscopic_descriptions(sections)
+
+    # Extract Clinical Impressions
+    clinical_impressions, shared_impression = extract_clinical_impression(
+        text, sections, specimens
     )
 
-    if micro_desc_matches:
-        # Case: Multiple specimens with identifiers
-        for match in micro_desc_matches:
-            specimen_id, _, description = (
-                match[0][0],
-                match[1].strip(),
-                match[2].strip(),
-            )
-            specimen_data.loc[
-                specimen_data["Specimen Identifier"] == specimen_id,
-                "Microscopic Description",
-            ] = description
-    else:
-        # Case: No valid identifiers and apply the entire description to all specimens
-        for specimen in specimen_data["Specimen Identifier"]:
-            specimen_data.loc[
-                specimen_data["Specimen Identifier"] == specimen,
-                "Microscopic Description",
-            ] = micro_desc_text
+    return {
+        "Accession No": [accession_no] * len(specimens),
+        "Specimen Identifier": specimen_ids,
+        "Specimen Description": [specimen_desc for _, specimen_desc in specimens],
+        "Diagnosis": [diagnoses.get(specimen_id, "") for specimen_id in specimen_ids],
+        "Microscopic Description": _specimen_values(
+            specimen_ids, descriptions, shared_description
+        ),
+        "Clinical Impression": _specimen_values(
+            specimen_ids, clinical_impressions, shared_impression
+        ),
+    }
+
+
+def _clean_newlines(specimen_data):
+    """
+    Cleans newline artifacts from the detail columns, keeping only the part before the
+    first newline.
+
+    Args:
+        specimen_data (pd.DataFrame): The DataFrame containing specimen details.
 
+    Returns:
+        pd.DataFrame: Updated DataFrame with cleaned detail columns.
+    """
+    for column in _DETAIL_COLUMNS:
+        cleaned = specimen_data[column].str.split("\n", n=1).str[0].str.strip()
+        # Keep non-string cells unchanged, as `remove_text_after_newline` does
+        specimen_data[column] = cleaned.where(cleaned.notna(), specimen_data[column])
     return specimen_data
 
 
@@ -248,106 +450,54 @@ def extract_specimen_details(text):
                       - "Microscopic Description"
                       - "Clinical Impression"
     """
-    specimen_data = extract_accession_and_specimens_df(text)
+    return _clean_newlines(_columns_df(_extract_specimen_columns(text)))
 
-    # Initialize columns
-    specimen_data["Diagnosis"] = ""
-    specimen_data["Microscopic Description"] = ""
-    specimen_data["Clinical Impression"] = ""
 
-    specimen_mapping = {
-        str(idx + 1): row["Specimen Identifier"]
-        for idx, row in specimen_data.iterrows()
-    }
-    specimen_mapping.update(
-        {
-            row["Specimen Identifier"]: row["Specimen Identifier"]
-            for _, row in specimen_data.iterrows()
-        }
-    )
-
-    # Extract Diagnosis
-    diagnosis_matches = re.findall(
-        r"([A-Z])[\.\):]?\s*(.+?)\n\s*--\s*(.+?)(?=\n[A-Z][\.\):]|\n\n|$)",
-        text,
-        re.IGNORECASE | re.DOTALL,
-    )
-    for match in diagnosis_matches:
-        specimen_id, _, diagnosis_text = (
-            match[0],
-            match[1].strip(),
-            match[2].strip(),
-        )
-        specimen_data.loc[
-            specimen_data["Specimen Identifier"] == specimen_id, "Diagnosis"
-        ] = diagnosis_text
-
-    # Extract Microscopic Description
-    specimen_data = add_microscopic_description(text, specimen_data)
-
-    # Extract Clinical Impressions
-    clinical_impressions = extract_clinical_impression(text)
-    # Regular expression for valid identifier formats
-    valid_identifier_pattern = r"^[A-Z][\)\.:]|#[0-9]+$"
-
-    for specimen_id, impression_text in clinical_impressions.items():
-        # Check if specimen_id does not match any valid identifier format
-        if not re.match(valid_identifier_pattern, specimen_id):
-            # Populate all rows with the field value
-            specimen_data["Clinical Impression"] = impression_text
-        else:
-            # Populate only matching rows
-            specimen_data.loc[
-                specimen_data["Specimen Identifier"] == specimen_id,
-                "Clinical Impression",
-            ] = impression_text
-
-    # Clean newline artifacts
-    for column in ["Diagnosis", "Microscopic Description", "Clinical Impression"]:
-        specimen_data[column] = specimen_data[column].apply(remove_text_after_newline)
-
-    return specimen_data
-
-
-def process_pathology_reports(df):
+def process_pathology_reports(df, max_workers=1):
     """
     Processes a DataFrame of pathology reports to extract structured details for
-    each specimen mentioned in the reports.
+    each specimen mentioned in the reports. Reports can optionally be parsed in
+    parallel worker processes.
 
     Args:
         df (pd.DataFrame): A DataFrame with a "Path Report Text" column.
+        max_workers (int, optional): The number of worker processes. Defaults to 1,
+            which parses the reports in the current process; None uses one worker per
+            CPU. With more than one worker, scripts must call this function under an
+            `if __name__ == "__main__":` guard.
 
     Returns:
         pd.DataFrame: A DataFrame where each row corresponds to a specimen with
                       columns for extracted details and original data.
     """
-    collected_data = pd.DataFrame()
     # Replace NaN values with an empty string before processing
     df["Path Report Text"] = df["Path Report Text"].fillna("")
 
-    # Process each row in the DataFrame
-    for _, row in df.iterrows():
-        # Extract details from the pathology report text
-        extracted_df = extract_specimen_details(row["Path Report Text"])
-
-        # Ensure extracted_df is not empty
-        if not extracted_df.empty:
-            # Replicate the original row for each new extracted row
-            original_row = row.to_frame().T
-            replicated_rows = pd.concat(
-                [original_row] * len(extracted_df), ignore_index=True
-            )
-
-            # Combine the replicated original rows with the new columns
-            combined_df = pd.concat(
-                [
-                    replicated_rows.reset_index(drop=True),
-                    extracted_df.reset_index(drop=True),
-                ],
-                axis=1,
+    # Extract details from the pathology report texts
+    texts = df["Path Report Text"].to_list()
+    # Leave None to the executor, which also caps the worker count on Windows
+    if max_workers == 1 or (max_workers is None and (os.cpu_count() or 1) == 1):
+        extracted_columns = map(_extract_specimen_columns, texts)
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            extracted_columns = list(
+                executor.map(
+                    _extract_specimen_columns, texts, chunksize=_REPORTS_PER_CHUNK
+                )
             )
 
-            # Append to the collected_data DataFrame
-            collected_data = pd.concat([collected_data, combined_df], ignore_index=True)
-
-    return collected_data
+    # Gather the specimens of all reports, tracking the row position of each report
+    positions = []
+    specimen_columns = {column: [] for column in _SPECIMEN_COLUMNS + _DETAIL_COLUMNS}
+    for position, report_columns in enumerate(extracted_columns):
+        positions.extend([position] * len(report_columns["Specimen Identifier"]))
+        for column, values in report_columns.items():
+            specimen_columns[column].extend(values)
+
+    if not positions:
+        return pd.DataFrame()
+
+    # Replicate the original row for each extracted row and combine them with the new columns
+    replicated_rows = df.iloc[positions].reset_index(drop=True)
+    extracted_df = _clean_newlines(_columns_df(specimen_columns))
+    return pd.concat([replicated_rows, extracted_df], axis=1)